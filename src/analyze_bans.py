@@ -1,6 +1,7 @@
 import csv
 import json
 from collections import Counter
+from itertools import combinations
 import matplotlib.pyplot as plt
 from datetime import datetime
 import os
@@ -36,6 +37,65 @@ def load_bans(file_path='cbl_bans.csv'):
 def parse_reasons(reason_string):
     return [reason.strip() for reason in reason_string.split(',') if reason.strip()]
 
+class ReasonCombinationIndex:
+    # Counts ban reason combinations in a single pass. Each combination is keyed by its
+    # sorted reason set (so "A, B" and "B, A" are the same) and interned to an integer id;
+    # memory grows with the number of distinct combinations, not the number of bans.
+    def __init__(self):
+        self.reason_ids = {}
+        self.reasons = []
+        self.combination_ids = {}
+        self.combinations = []
+        self.counts = Counter()
+
+    def _intern_reason(self, reason):
+        reason_id = self.reason_ids.get(reason)
+        if reason_id is None:
+            reason_id = len(self.reasons)
+            self.reason_ids[reason] = reason_id
+            self.reasons.append(reason)
+        return reason_id
+
+    def _key(self, reasons):
+        return tuple(sorted({self._intern_reason(reason) for reason in reasons}))
+
+    def add(self, reasons):
+        key = self._key(reasons)
+        combination_id = self.combination_ids.get(key)
+        if combination_id is None:
+            combination_id = len(self.combinations)
+            self.combination_ids[key] = combination_id
+            self.combinations.append(key)
+        self.counts[combination_id] += 1
+        return combination_id
+
+    def update(self, bans):
+        for ban in bans:
+            self.add(parse_reasons(ban['reason']))
+        return self
+
+    def label(self, combination_id):
+        return ', '.join(sorted(self.reasons[reason_id] for reason_id in self.combinations[combination_id]))
+
+    def top(self, k=10):
+        return [(self.label(combination_id), count) for combination_id, count in self.counts.most_common(k)]
+
+    def co_occurrence(self, *reasons):
+        # Number of bans whose reason set contains all of the given reasons
+        if any(reason not in self.reason_ids for reason in reasons):
+            return 0
+        wanted = {self.reason_ids[reason] for reason in reasons}
+        return sum(count for combination_id, count in self.counts.items()
+                   if wanted.issubset(self.combinations[combination_id]))
+
+    def top_co_occurrences(self, order=2, k=10):
+        subset_counts = Counter()
+        for combination_id, count in self.counts.items():
+            for subset in combinations(self.combinations[combination_id], order):
+                subset_counts[subset] += count
+        return [(', '.join(sorted(self.reasons[reason_id] for reason_id in subset)), count)
+                for subset, count in subset_counts.most_common(k)]
+
 def run_analysis(analysis_func, title, explanation, bans, *args):
     try:
         logging.info(f"Starting analysis: {title}")
@@ -178,8 +238,8 @@ def analyze_emerging_behaviors(bans):
     return new_reasons_trends.to_dict()
 
 def analyze_ban_reason_combinations(bans):
-    bans_df = pd.DataFrame(bans)
-    reason_combinations = bans_df['reason'].value_counts().head(10)
+    index = ReasonCombinationIndex().update(bans)
+    reason_combinations = pd.Series(dict(index.top(10)))
     reason_combinations.plot(kind='bar')
     plt.title('Top 10 Ban Reason Combinations')
     plt.xlabel('Reason Combination')